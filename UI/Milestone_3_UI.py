@@ -8,11 +8,16 @@ from streamlit_option_menu import option_menu
 import plotly.express as px
 import plotly.graph_objs as go
 import os
+from batch_io import DOWNLOAD_FORMATS, UPLOAD_TYPES, read_batch, write_batch
+from drift_monitor import DriftMonitor, load_reference_profile
 
 # Load pre-trained model
 model_path = os.path.join(os.path.dirname(__file__), 'lightgbm_model.pkl')
 model = joblib.load(model_path)
 
+# Training-set feature profile used for drift monitoring
+reference_profile = load_reference_profile()
+
 # Page configuration
 st.set_page_config(
     page_title="Online Payment Fraud Detection",
@@ -187,6 +192,12 @@ st.markdown("""
 # Initialize session state
 if 'history' not in st.session_state:
     st.session_state['history'] = []
+if 'drift_monitor' not in st.session_state:
+    st.session_state['drift_monitor'] = DriftMonitor(reference_profile)
+if 'history_file_ids' not in st.session_state:
+    st.session_state['history_file_ids'] = set()
+if 'drift_file_ids' not in st.session_state:
+    st.session_state['drift_file_ids'] = set()
 
 # Title (above navigation)
 st.markdown('<h1 class="main-title">💳 Online Payment Fraud Detection System</h1>', unsafe_allow_html=True)
@@ -234,7 +245,7 @@ def home():
         },
         {
             "title": "Batch Prediction",
-            "description": "Upload a CSV file containing multiple transactions for bulk fraud detection.",
+            "description": "Upload a CSV, compressed CSV, Parquet or Arrow file containing multiple transactions for bulk fraud detection.",
             "icon": "📊"
         },
         {
@@ -377,6 +388,20 @@ def home():
             </div> </a>
         """.format(get_base64(os.path.join(os.path.dirname(__file__), 'fraud_detect.jpg'))), unsafe_allow_html=True)
 
+def show_drift_alerts():
+    report = st.session_state.drift_monitor.report()
+    drifted = report[report['status'] == 'Drift']['feature'].tolist()
+    shifted = report[report['status'] == 'Moderate shift']['feature'].tolist()
+    unseen = report[report['out_of_range'] > 0]
+    if drifted:
+        st.error(f"⚠️ Feature drift detected against the training data: {', '.join(drifted)}. Predictions may be unreliable.")
+    elif shifted:
+        st.warning(f"Moderate distribution shift against the training data: {', '.join(shifted)}")
+    if len(unseen):
+        details = ', '.join(f"{row.feature} ({row.out_of_range})" for row in unseen.itertuples())
+        st.warning(f"Rows with values outside the training data or unrecognised transaction types: {details}")
+    return report
+
 def prediction():
     st.title("🔍 Fraud Prediction")
     option = st.selectbox("Choose Prediction Type", ["Individual Transaction", "Batch File Upload"])
@@ -460,6 +485,7 @@ def prediction():
                             'CASH_IN': 0, 'CASH_OUT': 1, 'DEBIT': 2, 'PAYMENT': 3, 'TRANSFER': 4
                         })
                         prediction = model.predict(data)[0]
+                        st.session_state.drift_monitor.update(data.to_numpy())
                         is_fraud = "Fraudulent" if prediction == 1 else "Not Fraudulent"
 
                         # Save to history
@@ -518,21 +544,27 @@ def prediction():
 
     elif option == "Batch File Upload":
         st.subheader("Batch File Upload Prediction")
-        uploaded_file = st.file_uploader("Upload CSV File", type=["csv"])
+        uploaded_file = st.file_uploader("Upload Transactions File (CSV, gzip/zstd CSV, Parquet, Arrow)", type=UPLOAD_TYPES)
 
         if uploaded_file:
-            df = pd.read_csv(uploaded_file)
-            # Check if required columns exist
+            # Only the model's input columns are decoded
             required_columns = ['type', 'amount', 'oldbalanceOrg', 'newbalanceDest']
-            if not all(col in df.columns for col in required_columns):
-                st.error("Upload Error: Dataset must contain columns: type, amount, oldbalanceOrg, newbalanceDest")
+            try:
+                df = read_batch(uploaded_file, uploaded_file.name, required_columns, numeric_columns=required_columns[1:])
+            except ValueError as error:
+                st.error(f"Upload Error: {error}")
                 return None
             # Map transaction types
             type_mapping = {'CASH_IN': 0, 'CASH_OUT': 1, 'DEBIT': 2, 'PAYMENT': 3, 'TRANSFER': 4, 0: 0, 0.25: 1, 0.5: 2, 0.75: 3, 1: 4}
             df['type'] = df['type'].map(type_mapping)
 
             # Predict
-            predictions = model.predict(df[['type', 'amount', 'oldbalanceOrg', 'newbalanceDest']])
+            features = df[['type', 'amount', 'oldbalanceOrg', 'newbalanceDest']]
+            predictions = model.predict(features)
+            # Reruns re-score the same upload; count each file in the drift monitor only once
+            if uploaded_file.file_id not in st.session_state.drift_file_ids:
+                st.session_state.drift_file_ids.add(uploaded_file.file_id)
+                st.session_state.drift_monitor.update(features.to_numpy())
             df['isFraud'] = ["Fraudulent" if pred == 1 else "Not Fraudulent" for pred in predictions]
 
             # Fraud Statistics
@@ -565,17 +597,24 @@ def prediction():
                 fig.update_layout(title_x=0.25)
                 st.plotly_chart(fig)
 
-            # Download buttons
-            csv = df.to_csv(index=False).encode()
-            st.download_button("Download Predicted CSV", data=csv, file_name="predictions.csv", mime="text/csv")
+            show_drift_alerts()
 
-            st.session_state.history.append({
-                "timestamp": datetime.now(),
-                "type": "Batch",
-                "file_name": uploaded_file.name,
-                "num_records": len(df),
-                "fraud_count": fraud_count
-            })
+            # Download buttons
+            download_format = st.selectbox("Download Format", list(DOWNLOAD_FORMATS))
+            extension, mime = DOWNLOAD_FORMATS[download_format]
+            st.download_button("Download Predictions", data=write_batch(df, download_format),
+                               file_name=f"predictions.{extension}", mime=mime)
+
+            # Reruns re-score the same upload; log each file in the history only once
+            if uploaded_file.file_id not in st.session_state.history_file_ids:
+                st.session_state.history_file_ids.add(uploaded_file.file_id)
+                st.session_state.history.append({
+                    "timestamp": datetime.now(),
+                    "type": "Batch",
+                    "file_name": uploaded_file.name,
+                    "num_records": len(df),
+                    "fraud_count": fraud_count
+                })
 
     st.markdown('</div>', unsafe_allow_html=True)
 
@@ -600,6 +639,16 @@ def history():
         st.download_button("Download History", csv, "history.csv", "text/csv")
     else:
         st.info("No history available.")
+
+    # Drift of everything scored this session against the training data
+    st.subheader("📈 Feature Drift Monitor")
+    report = show_drift_alerts()
+    st.caption(f"PSI and KS against {reference_profile['source']} ({reference_profile['num_records']} records); "
+               f"scores appear once a feature has enough samples.")
+    st.dataframe(report, use_container_width=True)
+    if st.button("Reset Drift Monitor"):
+        st.session_state.drift_monitor.reset()
+        st.rerun()
     st.markdown('</div>', unsafe_allow_html=True)
 
 def about():
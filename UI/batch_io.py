@@ -0,0 +1,111 @@
+import io
+
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import pyarrow.ipc as pa_ipc
+import pyarrow.parquet as pq
+
+# Extensions offered in the batch uploader
+UPLOAD_TYPES = ["csv", "gz", "zst", "parquet", "pq", "arrow", "feather", "ipc"]
+
+# Download formats: label -> (file extension, mime type)
+DOWNLOAD_FORMATS = {
+    "CSV": ("csv", "text/csv"),
+    "CSV (gzip)": ("csv.gz", "application/gzip"),
+    "CSV (zstd)": ("csv.zst", "application/zstd"),
+    "Parquet": ("parquet", "application/vnd.apache.parquet"),
+    "Arrow IPC": ("arrow", "application/vnd.apache.arrow.file"),
+}
+
+
+def detect_format(file_name):
+    name = file_name.lower()
+    if name.endswith(".gz"):
+        return "csv", "gzip"
+    if name.endswith(".zst"):
+        return "csv", "zstd"
+    if name.endswith((".parquet", ".pq")):
+        return "parquet", None
+    if name.endswith((".arrow", ".feather", ".ipc")):
+        return "arrow", None
+    return "csv", None
+
+
+def read_batch(file, file_name, columns, numeric_columns=()):
+    # Decode only `columns` from an uploaded batch file; raises ValueError if any are missing
+    # or the file cannot be parsed
+    fmt, compression = detect_format(file_name)
+    columns = list(columns)
+    try:
+        if fmt == "parquet":
+            parquet_file = pq.ParquetFile(file)
+            _check_columns(columns, parquet_file.schema_arrow.names)
+            table = parquet_file.read(columns=columns)
+        elif fmt == "arrow":
+            table = _read_ipc(file, columns)
+        else:
+            if compression:
+                file = pa.CompressedInputStream(file, compression)
+            convert_options = pa_csv.ConvertOptions(
+                include_columns=columns,
+                column_types={col: pa.float64() for col in numeric_columns},
+            )
+            # Record batches are decoded block by block, never holding the raw text in full
+            table = pa_csv.open_csv(file, convert_options=convert_options).read_all()
+        table = table.select(columns)
+        # Dictionary columns would become pandas categoricals, which LightGBM scores by code
+        for i, field in enumerate(table.schema):
+            if pa.types.is_dictionary(field.type):
+                table = table.set_column(i, field.name, table[i].cast(field.type.value_type))
+        for col in numeric_columns:
+            table = table.set_column(table.column_names.index(col), col, table[col].cast(pa.float64()))
+    except pa.ArrowKeyError as error:
+        # The CSV reader reports include_columns missing from the header this way
+        raise ValueError(_missing_columns_message(columns)) from error
+    except (pa.ArrowException, OSError) as error:
+        raise ValueError(f"Could not read {file_name}: {error}") from error
+    return table.to_pandas()
+
+
+def _missing_columns_message(columns):
+    return f"Dataset must contain columns: {', '.join(columns)}"
+
+
+def _check_columns(columns, available):
+    if any(col not in available for col in columns):
+        raise ValueError(_missing_columns_message(columns))
+
+
+def _read_ipc(file, columns):
+    # Arrow IPC comes either as a random-access file (Feather v2) or as a stream.
+    # The schema is read first so that only the requested fields are decoded.
+    try:
+        open_reader = pa_ipc.open_file
+        schema = open_reader(file).schema
+    except pa.ArrowInvalid:
+        open_reader = pa_ipc.open_stream
+        file.seek(0)
+        schema = open_reader(file).schema
+    _check_columns(columns, schema.names)
+    options = pa_ipc.IpcReadOptions(included_fields=sorted(schema.get_field_index(col) for col in columns))
+    file.seek(0)
+    return open_reader(file, options=options).read_all()
+
+
+def write_batch(df, label):
+    # Serialise a result DataFrame in one of DOWNLOAD_FORMATS
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    extension = DOWNLOAD_FORMATS[label][0]
+    sink = pa.BufferOutputStream()
+    if extension == "parquet":
+        pq.write_table(table, sink, compression="zstd")
+    elif extension == "arrow":
+        with pa_ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+    elif extension == "csv":
+        pa_csv.write_csv(table, sink)
+    else:
+        compression = "gzip" if extension.endswith(".gz") else "zstd"
+        with pa.CompressedOutputStream(sink, compression) as stream:
+            pa_csv.write_csv(table, stream)
+    return sink.getvalue().to_pybytes()
@@ -0,0 +1,147 @@
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+# Model input columns, in the order the model is fed, named as in the training set
+FEATURES = ['type', 'amount', 'oldbalanceOrg', 'newbalanceOrig']
+CATEGORICAL_FEATURES = ['type']
+TRANSACTION_TYPES = ['CASH_IN', 'CASH_OUT', 'DEBIT', 'PAYMENT', 'TRANSFER']
+
+# Common PSI rule of thumb: < 0.1 stable, 0.1 - 0.25 moderate shift, > 0.25 major shift
+PSI_WARN = 0.1
+PSI_ALERT = 0.25
+MIN_SAMPLES = 50
+# Share of rows outside the training range (or with an unknown category) that is flagged as drift
+OUT_OF_RANGE_ALERT = 0.05
+
+REFERENCE_PROFILE_PATH = os.path.join(os.path.dirname(__file__), 'reference_profile.json')
+TRAINING_DATA_PATH = os.path.join(os.path.dirname(__file__), '..', 'Final_cleaned_preprocessed_DataSet.csv')
+
+
+def build_reference_profile(csv_path=TRAINING_DATA_PATH, bins=20):
+    # Quantile bin edges and bin proportions of every model feature in the training set
+    df = pd.read_csv(csv_path, usecols=FEATURES)
+    profile = {'source': os.path.basename(csv_path), 'num_records': len(df), 'features': {}}
+    for feature in FEATURES:
+        values = df[feature].to_numpy(dtype=float)
+        if feature in CATEGORICAL_FEATURES:
+            counts = np.bincount(values.astype(int), minlength=len(TRANSACTION_TYPES))
+            profile['features'][feature] = {
+                'kind': 'categorical',
+                'proportions': (counts / counts.sum()).tolist(),
+            }
+        else:
+            # Interior cut points; heavy ties (e.g. zero balances) collapse into one bin
+            edges = np.unique(np.quantile(values, np.linspace(0, 1, bins + 1)[1:-1]))
+            counts = np.bincount(np.searchsorted(edges, values, side='right'), minlength=len(edges) + 1)
+            profile['features'][feature] = {
+                'kind': 'numeric',
+                'edges': edges.tolist(),
+                'proportions': (counts / counts.sum()).tolist(),
+                'min': float(values.min()),
+                'max': float(values.max()),
+            }
+    return profile
+
+
+def save_reference_profile(profile, path=REFERENCE_PROFILE_PATH):
+    with open(path, 'w') as f:
+        json.dump(profile, f, indent=2)
+
+
+def load_reference_profile(path=REFERENCE_PROFILE_PATH):
+    with open(path) as f:
+        return json.load(f)
+
+
+def population_stability_index(expected, actual, eps=1e-4):
+    expected = np.clip(np.asarray(expected, dtype=float), eps, None)
+    actual = np.clip(np.asarray(actual, dtype=float), eps, None)
+    return float(np.sum((actual - expected) * np.log(actual / expected)))
+
+
+def ks_statistic(expected, actual):
+    # Largest CDF gap, evaluated at the reference bin edges
+    return float(np.max(np.abs(np.cumsum(expected) - np.cumsum(actual))))
+
+
+class DriftMonitor:
+    """Fixed-memory summary of scored transactions, compared against the training profile.
+
+    Each numeric feature keeps one counter per reference quantile bin and each
+    categorical feature one counter per category, so memory does not grow with
+    the number of scored rows and an update is a single vectorised bincount.
+    Values outside the training range and unrecognised type codes are also
+    counted, and a high share of them is reported as drift on its own.
+    """
+
+    def __init__(self, profile):
+        self.profile = profile
+        self.num_records = 0
+        self.counts = {}
+        self.edges = {}
+        self.out_of_range = {}
+        for feature in FEATURES:
+            spec = profile['features'][feature]
+            if spec['kind'] == 'numeric':
+                self.edges[feature] = np.asarray(spec['edges'], dtype=float)
+            self.out_of_range[feature] = 0
+            self.counts[feature] = np.zeros(len(spec['proportions']), dtype=np.int64)
+
+    def update(self, features):
+        # `features` holds the model input columns in FEATURES order, whatever their names
+        values = np.asarray(features, dtype=float).reshape(-1, len(FEATURES))
+        if not len(values):
+            return
+        for i, feature in enumerate(FEATURES):
+            column = values[:, i]
+            size = len(self.counts[feature])
+            if feature in self.edges:
+                column = column[~np.isnan(column)]
+                spec = self.profile['features'][feature]
+                idx = np.searchsorted(self.edges[feature], column, side='right')
+                self.out_of_range[feature] += int(np.count_nonzero((column < spec['min']) | (column > spec['max'])))
+            else:
+                # Missing, fractional or unknown codes come from labels the type mapping did not recognise
+                known = (column >= 0) & (column < size) & (column == np.floor(column))
+                self.out_of_range[feature] += len(values) - int(np.count_nonzero(known))
+                idx = column[known].astype(np.int64)
+            self.counts[feature] += np.bincount(idx, minlength=size)
+        self.num_records += len(values)
+
+    def report(self):
+        rows = []
+        for feature in FEATURES:
+            spec = self.profile['features'][feature]
+            counts = self.counts[feature]
+            total = counts.sum()
+            out_of_range = self.out_of_range[feature]
+            row = {'feature': feature, 'samples': int(total), 'psi': None, 'ks': None,
+                   'out_of_range': out_of_range, 'status': 'Collecting'}
+            seen = total if spec['kind'] == 'numeric' else total + out_of_range
+            if seen >= MIN_SAMPLES and out_of_range / seen >= OUT_OF_RANGE_ALERT:
+                row['status'] = 'Drift'
+            if total >= MIN_SAMPLES:
+                actual = counts / total
+                row['psi'] = round(population_stability_index(spec['proportions'], actual), 4)
+                if spec['kind'] == 'numeric':
+                    row['ks'] = round(ks_statistic(spec['proportions'], actual), 4)
+                if row['psi'] >= PSI_ALERT or row['status'] == 'Drift':
+                    row['status'] = 'Drift'
+                elif row['psi'] >= PSI_WARN:
+                    row['status'] = 'Moderate shift'
+                else:
+                    row['status'] = 'Stable'
+            rows.append(row)
+        return pd.DataFrame(rows)
+
+    def reset(self):
+        self.__init__(self.profile)
+
+
+if __name__ == '__main__':
+    # Regenerate the reference profile after retraining on a new dataset
+    save_reference_profile(build_reference_profile())
+    print("Reference profile saved to:", REFERENCE_PROFILE_PATH)
@@ -0,0 +1,325 @@
+import hashlib
+import json
+import os
+import pickle
+import time
+
+import numpy as np
+import pandas as pd
+
+CACHE_DIR = ".eda_cache"
+TARGET_COLUMN = "isFraud"
+MAX_CATEGORIES = 50       # object columns with more distinct values stop being counted
+SAMPLE_PER_CLASS = 5000   # stratified sample rows kept per target class
+CHUNK_SIZE = 500_000
+HASH_BLOCK = 1 << 20
+MAX_CACHE_ENTRIES = 8     # least recently used summaries beyond this are evicted
+
+
+class EDASummary:
+    """Running summary of a dataset, built in one pass over chunks of rows.
+
+    Numeric moments and the covariance matrix are merged chunk by chunk
+    (Chan et al.), so appending data only needs the new rows. The correlation
+    matrix uses rows where every numeric column is present. Quartiles in
+    `describe()` are estimated from the per-class sample, with each row
+    weighted by how many rows of its class it stands for.
+    """
+
+    def __init__(self, target=TARGET_COLUMN, sample_per_class=SAMPLE_PER_CLASS, seed=42):
+        self.target = target
+        self.sample_per_class = sample_per_class
+        self.rng = np.random.default_rng(seed)
+        self.num_rows = 0
+        self.columns = None
+        self.dtypes = None
+        self.numeric = None
+        self.head = None
+        self.non_null = None
+        self.minimum = None
+        self.maximum = None
+        self.count = None       # per-column non-null count
+        self.mean = None        # per-column mean over non-null values
+        self.m2 = None          # per-column sum of squared deviations
+        self.cov_n = 0
+        self.cov_mean = None
+        self.comoment = None    # co-moment matrix over complete rows
+        self.category_counts = {}
+        self.sample = None
+
+    def update(self, chunk):
+        if not len(chunk):
+            return self
+        if self.columns is None:
+            self._init_schema(chunk)
+        chunk = chunk[self.columns]
+
+        self.num_rows += len(chunk)
+        self.non_null += chunk.notna().sum()
+        self._update_moments(chunk[self.numeric].to_numpy(dtype=float))
+        self._update_categories(chunk)
+        self._update_sample(chunk)
+        return self
+
+    def _init_schema(self, chunk):
+        self.columns = list(chunk.columns)
+        self.dtypes = chunk.dtypes
+        self.numeric = list(chunk.select_dtypes(include="number").columns)
+        self.head = chunk.head(5).copy()
+        self.non_null = pd.Series(0, index=self.columns)
+        k = len(self.numeric)
+        self.minimum = np.full(k, np.inf)
+        self.maximum = np.full(k, -np.inf)
+        self.mean = np.zeros(k)
+        self.m2 = np.zeros(k)
+        self.count = np.zeros(k)
+        self.cov_mean = np.zeros(k)
+        self.comoment = np.zeros((k, k))
+        for col in self.columns:
+            if col not in self.numeric or col == self.target:
+                self.category_counts[col] = pd.Series(dtype="int64")
+
+    def _update_moments(self, values):
+        present = ~np.isnan(values)
+        n_b = present.sum(axis=0)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean_b = np.where(n_b > 0, np.nansum(values, axis=0) / n_b, 0.0)
+            m2_b = np.nansum((values - mean_b) ** 2, axis=0)
+            n = self.count + n_b
+            delta = mean_b - self.mean
+            self.mean = np.where(n > 0, self.mean + delta * n_b / n, 0.0)
+            self.m2 = self.m2 + m2_b + np.where(n > 0, delta ** 2 * self.count * n_b / n, 0.0)
+        self.count = n
+        self.minimum = np.fmin(self.minimum, np.nanmin(values, axis=0, initial=np.inf))
+        self.maximum = np.fmax(self.maximum, np.nanmax(values, axis=0, initial=-np.inf))
+
+        complete = values[present.all(axis=1)]
+        if len(complete):
+            n_b = len(complete)
+            mean_b = complete.mean(axis=0)
+            centered = complete - mean_b
+            n = self.cov_n + n_b
+            delta = mean_b - self.cov_mean
+            self.comoment += centered.T @ centered + np.outer(delta, delta) * self.cov_n * n_b / n
+            self.cov_mean += delta * n_b / n
+            self.cov_n = n
+
+    def _update_categories(self, chunk):
+        for col in list(self.category_counts):
+            counts = self.category_counts[col]
+            if counts is None:
+                continue
+            counts = counts.add(chunk[col].value_counts(), fill_value=0).astype("int64")
+            # High-cardinality columns (e.g. account names) are not worth counting
+            self.category_counts[col] = counts if len(counts) <= MAX_CATEGORIES else None
+
+    def _update_sample(self, chunk):
+        # Bottom-k on random keys per class: a uniform sample that merges across appends
+        keyed = chunk.assign(_key=self.rng.random(len(chunk)))
+        if self.sample is not None:
+            keyed = pd.concat([self.sample, keyed], ignore_index=True)
+        keyed = keyed.sort_values("_key")
+        if self.target in keyed.columns:
+            keyed = keyed.groupby(self.target, dropna=False).head(self.sample_per_class)
+        else:
+            keyed = keyed.head(self.sample_per_class)
+        self.sample = keyed.reset_index(drop=True)
+
+    def info(self):
+        return pd.DataFrame({
+            "non_null": self.non_null,
+            "null": self.num_rows - self.non_null,
+            "dtype": self.dtypes.astype(str),
+        })
+
+    def describe(self):
+        std = np.sqrt(self.m2 / np.maximum(self.count - 1, 1))
+        weights = self._sample_weights()
+        quartiles = np.array([_weighted_quantiles(self.sample[col].to_numpy(dtype=float), weights, [0.25, 0.5, 0.75])
+                              for col in self.numeric]).T.reshape(3, len(self.numeric))
+        return pd.DataFrame(
+            [self.count, self.mean, std, self.minimum,
+             *quartiles, self.maximum],
+            index=["count", "mean", "std", "min", "25%", "50%", "75%", "max"],
+            columns=self.numeric,
+        )
+
+    def correlation(self):
+        std = np.sqrt(np.diag(self.comoment))
+        with np.errstate(invalid="ignore", divide="ignore"):
+            corr = self.comoment / np.outer(std, std)
+        return pd.DataFrame(corr, index=self.numeric, columns=self.numeric)
+
+    def value_counts(self, column):
+        counts = self.category_counts.get(column)
+        if counts is None:
+            raise KeyError(f"No category counts kept for column '{column}'")
+        return counts.sort_values(ascending=False)
+
+    def class_balance(self):
+        return self.value_counts(self.target)
+
+    def _sample_weights(self):
+        # Number of full-data rows each sample row represents; rare classes are oversampled
+        if self.target not in self.sample.columns:
+            return np.full(len(self.sample), self.num_rows / max(len(self.sample), 1))
+        kept = self.sample[self.target].map(self.sample[self.target].value_counts())
+        total = self.sample[self.target].map(self.class_balance())
+        return (total / kept).to_numpy(dtype=float)
+
+    def stratified_sample(self, n=None):
+        # Plot-sized sample keeping each class's share of the full data. Without `n`,
+        # the largest such sample the kept rows allow.
+        sample = self.sample.drop(columns="_key")
+        if self.target not in sample.columns:
+            return sample if n is None else sample.head(n)
+        shares = self.class_balance() / self.num_rows
+        groups = dict(list(sample.groupby(self.target)))
+        largest = min(len(groups[label]) / share for label, share in shares.items() if share > 0)
+        n = largest if n is None else min(n, largest)
+        parts = [groups[label].head(int(round(n * share))) for label, share in shares.items() if label in groups]
+        return pd.concat(parts, ignore_index=True)
+
+
+def _weighted_quantiles(values, weights, quantiles):
+    present = ~np.isnan(values)
+    values, weights = values[present], weights[present]
+    if not len(values):
+        return [np.nan] * len(quantiles)
+    order = np.argsort(values)
+    values, weights = values[order], weights[order]
+    # Midpoint rule on the weighted CDF, matching linear interpolation for equal weights
+    cdf = (np.cumsum(weights) - 0.5 * weights) / weights.sum()
+    return np.interp(quantiles, cdf, values)
+
+
+def _frame_fingerprint(df):
+    # Per-row hashes, so a frame with rows appended can be matched against its prefix
+    return pd.util.hash_pandas_object(df, index=False).to_numpy()
+
+
+def _digest(row_hashes):
+    return hashlib.sha256(row_hashes.tobytes()).hexdigest()
+
+
+INDEX_FILE = "index.json"
+
+
+def _cache_path(cache_dir, key):
+    return os.path.join(cache_dir, f"{key}.pkl")
+
+
+def _load_index(cache_dir):
+    # key -> {"kind", "rows" or "bytes", ...}; lets lookups skip unpickling summaries
+    path = os.path.join(cache_dir, INDEX_FILE)
+    if not os.path.exists(path):
+        return {}
+    with open(path) as f:
+        return json.load(f)
+
+
+def _save_index(cache_dir, index):
+    with open(os.path.join(cache_dir, INDEX_FILE), "w") as f:
+        json.dump(index, f, indent=2)
+
+
+def _load_summary(cache_dir, key):
+    with open(_cache_path(cache_dir, key), "rb") as f:
+        return pickle.load(f)
+
+
+def _remove(cache_dir, index, key):
+    index.pop(key, None)
+    if os.path.exists(_cache_path(cache_dir, key)):
+        os.remove(_cache_path(cache_dir, key))
+
+
+def _cache_hit(cache_dir, index, key):
+    index[key]["used"] = time.time()
+    _save_index(cache_dir, index)
+    return _load_summary(cache_dir, key)
+
+
+def _store(cache_dir, index, key, meta, summary, superseded=None):
+    # Save a summary, drop the entry it was extended from (it can no longer be reused)
+    # and evict the least recently used entries beyond MAX_CACHE_ENTRIES
+    os.makedirs(cache_dir, exist_ok=True)
+    with open(_cache_path(cache_dir, key), "wb") as f:
+        pickle.dump(summary, f)
+    index[key] = dict(meta, used=time.time())
+    if superseded is not None and superseded != key:
+        _remove(cache_dir, index, superseded)
+    for stale in sorted(index, key=lambda k: index[k].get("used", 0))[:-MAX_CACHE_ENTRIES]:
+        _remove(cache_dir, index, stale)
+    _save_index(cache_dir, index)
+
+
+def summarize_frame(df, cache_dir=CACHE_DIR, chunk_size=CHUNK_SIZE):
+    # Summary of an in-memory DataFrame; reuses a cached summary of any prefix of its rows
+    index = _load_index(cache_dir)
+    row_hashes = _frame_fingerprint(df)
+    key = _digest(row_hashes)
+    if key in index:
+        return _cache_hit(cache_dir, index, key)
+
+    base = None
+    for entry_key, meta in index.items():
+        rows = meta["rows"] if meta["kind"] == "frame" else 0
+        if 0 < rows < len(df) and (base is None or rows > index[base]["rows"]) \
+                and _digest(row_hashes[:rows]) == entry_key:
+            base = entry_key
+
+    summary, start = (_load_summary(cache_dir, base), index[base]["rows"]) if base else (EDASummary(), 0)
+    for offset in range(start, len(df), chunk_size):
+        summary.update(df.iloc[offset:offset + chunk_size])
+    _store(cache_dir, index, key, {"kind": "frame", "rows": len(df)}, summary, superseded=base)
+    return summary
+
+
+def summarize_csv(path, cache_dir=CACHE_DIR, chunk_size=CHUNK_SIZE):
+    # Summary of a CSV file without loading it whole; appended rows are read on their own
+    index = _load_index(cache_dir)
+    lengths = {meta["bytes"] for meta in index.values()
+               if meta["kind"] == "csv" and meta["complete_lines"]}
+    size = os.path.getsize(path)
+    hasher = hashlib.sha256()
+    prefixes = {}
+    position = 0
+    with open(path, "rb") as f:
+        while True:
+            block = f.read(HASH_BLOCK)
+            if not block:
+                break
+            # Record the running hash at every cached length falling inside this block
+            for length in sorted(l for l in lengths if position < l < position + len(block)):
+                partial = hasher.copy()
+                partial.update(block[:length - position])
+                prefixes[length] = partial.hexdigest()
+            hasher.update(block)
+            position += len(block)
+            if position in lengths:
+                prefixes[position] = hasher.hexdigest()
+        f.seek(max(size - 1, 0))
+        complete_lines = f.read(1) in (b"\n", b"")
+    key = hasher.hexdigest()
+    if key in index:
+        return _cache_hit(cache_dir, index, key)
+
+    matches = [length for length, digest in prefixes.items()
+               if length < size and digest in index and index[digest]["kind"] == "csv"]
+    base = prefixes[max(matches)] if matches else None
+
+    if base:
+        summary = _load_summary(cache_dir, base)
+        with open(path, "rb") as f:
+            f.seek(index[base]["bytes"])
+            reader = pd.read_csv(f, header=None, names=summary.columns, chunksize=chunk_size)
+            for chunk in reader:
+                summary.update(chunk)
+    else:
+        summary = EDASummary()
+        for chunk in pd.read_csv(path, chunksize=chunk_size):
+            summary.update(chunk)
+    meta = {"kind": "csv", "bytes": size, "complete_lines": complete_lines}
+    _store(cache_dir, index, key, meta, summary, superseded=base)
+    return summary